@@ -1,52 +1,313 @@
 # Created by Eyal Asulin™ - [PEP8]
+import os
 import socket
 import keyboard
 import cv2
+import numpy as np
 import threading
 import time
 import sys
+import queue
+import re
+import selectors
+from multiprocessing import shared_memory
 from inputs import get_gamepad
 import math
 
+# evdev blocks on the kernel event fd instead of waking every 10 ms to
+# poll, and exposes integer event codes; Linux-only, so the inputs-based
+# polling loop stays as the fallback
+try:
+    from evdev import InputDevice, ecodes, list_devices
+    _HAS_EVDEV = True
+except ImportError:
+    _HAS_EVDEV = False
 
-def send_command(command_socket, command_addr, command, debug=True, retry=3, timeout=5):
+
+# Tello status replies look like b"pitch:0;roll:0;yaw:0;...;" — one compiled
+# pattern extracts all key/value pairs in a single pass over the raw bytes,
+# so only the matched fields are ever decoded
+_STATUS_RE = re.compile(rb'([^:;]+):([^;]*)')
+
+# The hot commands are a small fixed alphabet; encode them once at import
+# instead of on every keypress
+_CMDS = {name: name.encode('ascii') for name in (
+    'command', 'takeoff', 'land', 'battery?', 'streamon', 'streamoff',
+    'emergency', 'status?')}
+
+# Movement commands for the controller's fixed 30 cm step, pre-built so the
+# periodic stick tick doesn't format a string per send
+_UP30 = b'up 30'
+_DOWN30 = b'down 30'
+
+# Flight commands are acknowledged only on completion: a takeoff takes
+# ~5-10 s and land/up/down take seconds too. They get a single attempt
+# with a long reply budget — re-sending a movement command while the drone
+# is still executing it would queue a second move, and the late ack would
+# be mistaken for a timeout. Query/config commands keep the short retries.
+MOVE_TIMEOUT = 7
+TAKEOFF_TIMEOUT = 20
+
+
+def _encode_command(command):
+    """
+    Return the wire bytes for a command, reusing pre-encoded constants
+    """
+    if isinstance(command, (bytes, bytearray)):
+        return command
+    # UTF-8 fallback: wifi credentials typed by the user may be non-ASCII
+    return _CMDS.get(command) or command.encode()
+
+
+# Replies from the drone are read by a single receiver thread and handed to
+# send_command through this queue, so keyboard callbacks, video control and
+# status requests never race on recvfrom or on the socket timeout.
+_reply_queue = queue.Queue()
+
+# Only one command may be in flight at a time; replies carry no id, so the
+# next datagram in the queue is by definition the reply to the last send.
+_command_lock = threading.Lock()
+
+
+def _receiver_loop(sock):
+    """
+    Read datagrams from the command socket forever and queue them for
+    whichever send_command call is waiting.
+
+    Readiness is multiplexed through a selector so nothing ever has to
+    mutate the socket's timeout state after setup.
+    """
+    sel = selectors.DefaultSelector()
+    sel.register(sock, selectors.EVENT_READ)
+    # Receive into one preallocated buffer instead of allocating a fresh
+    # bytes object per datagram; only the received slice is copied out
+    rx_buf = bytearray(2048)
+    rx_view = memoryview(rx_buf)
+    try:
+        while True:
+            try:
+                # Short timeout so a socket closed during shutdown is
+                # noticed: closing the fd deregisters it from epoll, so
+                # select just returns empty forever — the closed socket
+                # must be detected explicitly
+                if not sel.select(timeout=1.0):
+                    if sock.fileno() == -1:
+                        break  # Socket closed during shutdown
+                    continue
+                nbytes, addr = sock.recvfrom_into(rx_buf)
+            except OSError:
+                break  # Socket closed during shutdown
+            _reply_queue.put((addr, bytes(rx_view[:nbytes])))
+    finally:
+        sel.close()
+
+
+def start_receiver(command_socket):
+    """
+    Start the daemon thread that owns all reads on the command socket
+
+    Sends and receives deliberately share this one socket: with a second
+    SO_REUSEPORT socket on 8889 the kernel would hash each reply to an
+    arbitrary one of the two, so the receiver could never be guaranteed to
+    see it. Send and receive on a single UDP socket don't contend in the
+    kernel, and the reply queue already decouples senders from the read.
+    """
+    # One-time switch to non-blocking; the selector handles all waiting
+    command_socket.setblocking(False)
+    receiver = threading.Thread(target=_receiver_loop, args=(command_socket,))
+    receiver.daemon = True
+    receiver.start()
+    return receiver
+
+
+def _drain_replies():
+    """
+    Throw away any replies still queued from earlier commands.
+
+    A late reply to a previous command could otherwise be consumed as the
+    reply to the next one, hiding real failures.
+    """
+    while True:
+        try:
+            _reply_queue.get_nowait()
+        except queue.Empty:
+            break
+
+
+def send_command_async(command_socket, command_addr, command):
+    """
+    Fire-and-forget send with no wait for a reply.
+
+    Used for emergency and shutdown commands that must never block: if the
+    drone is unresponsive, waiting on a reply would stall the keyboard
+    callback thread for the full retry budget.
+    """
+    try:
+        _send_datagram(command_socket, _encode_command(command), command_addr)
+        return True
+    except Exception as e:
+        print(f"   Error sending command: {str(e)}")
+        return False
+
+
+_MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+
+# MSG_CONFIRM tells the kernel the peer is known alive, suppressing the
+# periodic unicast ARP re-probe that otherwise delays a send (Linux only;
+# zero elsewhere)
+_MSG_CONFIRM = getattr(socket, 'MSG_CONFIRM', 0)
+
+
+def _send_datagram(sock, payload, addr):
+    """
+    Lowest-level send for command datagrams.
+
+    Uses sendmsg with the payload as a single iovec plus MSG_CONFIRM where
+    the platform provides them, falling back to plain sendto.
+    """
+    if hasattr(sock, 'sendmsg'):
+        return sock.sendmsg((payload,), (), _MSG_CONFIRM, addr)
+    return sock.sendto(payload, addr)
+
+# On Linux, sendmmsg(2) puts all copies of a burst on the wire in one
+# syscall; elsewhere (or if libc can't be loaded) we fall back to a tight
+# sendto loop.
+_sendmmsg = None
+if sys.platform.startswith('linux'):
+    import ctypes
+    import ctypes.util
+
+    class _Iovec(ctypes.Structure):
+        _fields_ = [('iov_base', ctypes.c_void_p),
+                    ('iov_len', ctypes.c_size_t)]
+
+    class _Msghdr(ctypes.Structure):
+        _fields_ = [('msg_name', ctypes.c_void_p),
+                    ('msg_namelen', ctypes.c_uint32),
+                    ('msg_iov', ctypes.POINTER(_Iovec)),
+                    ('msg_iovlen', ctypes.c_size_t),
+                    ('msg_control', ctypes.c_void_p),
+                    ('msg_controllen', ctypes.c_size_t),
+                    ('msg_flags', ctypes.c_int)]
+
+    class _Mmsghdr(ctypes.Structure):
+        _fields_ = [('msg_hdr', _Msghdr),
+                    ('msg_len', ctypes.c_uint)]
+
+    class _SockaddrIn(ctypes.Structure):
+        _fields_ = [('sin_family', ctypes.c_uint16),
+                    ('sin_port', ctypes.c_uint16),
+                    ('sin_addr', ctypes.c_uint8 * 4),
+                    ('sin_zero', ctypes.c_uint8 * 8)]
+
+    try:
+        _sendmmsg = ctypes.CDLL(ctypes.util.find_library('c'),
+                                use_errno=True).sendmmsg
+    except (OSError, AttributeError, TypeError):
+        _sendmmsg = None
+
+
+def _sendmmsg_burst(sock, payload, addr, count):
+    """
+    Send count copies of payload to addr in a single sendmmsg(2) syscall
+    """
+    host, port = addr
+    name = _SockaddrIn(socket.AF_INET, socket.htons(port),
+                       (ctypes.c_uint8 * 4).from_buffer_copy(socket.inet_aton(host)),
+                       (ctypes.c_uint8 * 8)())
+    buf = ctypes.create_string_buffer(payload, len(payload))
+    iov = _Iovec(ctypes.cast(buf, ctypes.c_void_p), len(payload))
+    msgs = (_Mmsghdr * count)()
+    for i in range(count):
+        msgs[i].msg_hdr.msg_name = ctypes.cast(ctypes.pointer(name), ctypes.c_void_p)
+        msgs[i].msg_hdr.msg_namelen = ctypes.sizeof(name)
+        msgs[i].msg_hdr.msg_iov = ctypes.pointer(iov)
+        msgs[i].msg_hdr.msg_iovlen = 1
+    sent = _sendmmsg(sock.fileno(), msgs, count, _MSG_DONTWAIT)
+    if sent < 0:
+        raise OSError(ctypes.get_errno(), 'sendmmsg failed')
+    return sent
+
+
+def send_burst(command_socket, command_addr, command, count=3):
+    """
+    Send the same datagram several times back to back with no interleaved
+    work, so the packet train is as tight as possible.
+
+    Used for emergency, where the command is repeated for reliability: the
+    smaller the gap between copies, the lower the chance all of them hit
+    the same transient loss. MSG_DONTWAIT guarantees the sends never block.
+    """
+    payload = _encode_command(command)
+
+    if _sendmmsg is not None:
+        try:
+            return _sendmmsg_burst(command_socket, payload, command_addr, count)
+        except OSError:
+            pass  # Fall back to per-datagram sends
+
+    sent = 0
+    for _ in range(count):
+        try:
+            command_socket.sendto(payload, _MSG_DONTWAIT, command_addr)
+            sent += 1
+        except (BlockingIOError, InterruptedError):
+            pass
+        except Exception as e:
+            print(f"   Error sending command: {str(e)}")
+            break
+    return sent
+
+
+def send_command(command_socket, command_addr, command, debug=True, retry=3,
+                 initial_timeout=0.3, backoff=2.0, binary=False):
     """
     Send command to Tello and get response with timeout and retry mechanisms
+
+    The drone answers queries in well under 100 ms, so the defaults start
+    with a short timeout and double it on each retry instead of waiting a
+    fixed 5 s per attempt. A lost packet now costs ~0.3 s instead of 6 s.
+    Flight commands ack only on completion — callers pass retry=1 with
+    MOVE_TIMEOUT/TAKEOFF_TIMEOUT so the command is never re-sent while the
+    drone is still executing it.
+
+    With binary=True the reply is returned as raw bytes, skipping the
+    decode for callers that parse it themselves (battery?, status?).
     """
+    # Comma-form prints hand formatting to print() itself, so nothing is
+    # allocated up front for messages that are skipped when debug is off
     if debug:
-        print(f"   Sending command: {command}")
-    
-    # Set socket timeout for receiving response
-    command_socket.settimeout(timeout)
-    
-    for attempt in range(retry):
-        try:
-            # Send the command
-            if isinstance(command, str):
-                command_socket.sendto(command.encode(), command_addr)
-            else:
-                command_socket.sendto(command, command_addr)
-            
-            # Wait for response
+        print("   Sending command:", command)
+
+    with _command_lock:
+        # Discard any stale replies from earlier commands before sending
+        _drain_replies()
+
+        payload = _encode_command(command)
+        for attempt in range(retry):
             try:
-                response, ip = command_socket.recvfrom(1024)
-                response = response.decode().strip()
-                if debug:
-                    print(f"   Response: {response}")
-                return response
-            except socket.timeout:
+                # Send the command
+                _send_datagram(command_socket, payload, command_addr)
+
+                # Wait for the receiver thread to hand us the reply,
+                # backing off exponentially on each retry
+                try:
+                    ip, response = _reply_queue.get(
+                        timeout=initial_timeout * backoff ** attempt)
+                    if not binary:
+                        response = response.decode().strip()
+                    if debug:
+                        print("   Response:", response)
+                    return response
+                except queue.Empty:
+                    if debug:
+                        print("   Timeout waiting for response (attempt", f"{attempt+1}/{retry})")
+            except Exception as e:
                 if debug:
-                    print(f"   Timeout waiting for response (attempt {attempt+1}/{retry})")
-        except Exception as e:
-            if debug:
-                print(f"   Error sending command: {str(e)} (attempt {attempt+1}/{retry})")
-        
-        # Wait before retry
-        if attempt < retry - 1:
-            time.sleep(1)
-    
+                    print("   Error sending command:", e, f"(attempt {attempt+1}/{retry})")
+
     if debug:
-        print(f"   Failed to get response after {retry} attempts for command: {command}")
+        print("   Failed to get response after", retry, "attempts for command:", command)
     return None
 
 def check_connection(command_socket, command_addr):
@@ -59,12 +320,17 @@ def check_connection(command_socket, command_addr):
     if response == "ok":
         print("    Connection verified!")
         
-        # Check battery level
-        battery = send_command(command_socket, command_addr, "battery?")
-        if battery and battery.isdigit():
-            print(f"    Battery level: {battery}%")
-            if int(battery) < 20:
-                print("    Warning: Battery level low!")
+        # Check battery level; parse the raw bytes in one pass
+        battery = send_command(command_socket, command_addr, "battery?", binary=True)
+        if battery:
+            try:
+                level = int(battery)
+            except ValueError:
+                level = None
+            if level is not None:
+                print(f"    Battery level: {level}%")
+                if level < 20:
+                    print("    Warning: Battery level low!")
         
         return True
     else:
@@ -72,10 +338,54 @@ def check_connection(command_socket, command_addr):
         print("   ℹ Tello WiFi name usually starts with 'TELLO-'")
         return False
 
+# FFmpeg UDP options: tolerate input overruns and give the demuxer a large
+# FIFO so short stalls don't drop packets
+TELLO_VIDEO_URL = 'udp://192.168.10.1:11111?overrun_nonfatal=1&fifo_size=5000000'
+
+# FFmpeg demuxer options for the capture: skip input buffering and long
+# stream probing in favour of decode latency. Must be set before the
+# VideoCapture is constructed; an existing value in the environment wins.
+os.environ.setdefault('OPENCV_FFMPEG_CAPTURE_OPTIONS',
+                      'fflags;nobuffer|flags;low_delay|probesize;32')
+
+# Let FFmpeg's own read-retry budget ride out a slow stream start instead
+# of tearing the capture down and reopening it from Python
+os.environ.setdefault('OPENCV_FFMPEG_READ_ATTEMPTS', '8192')
+
+
+def _probe_video_stream(timeout=3):
+    """
+    Wait until the first video datagram actually arrives on port 11111.
+
+    Replaces the blind two-second sleep after streamon: the stream is
+    usually up in a fraction of that, and a dead stream is detected just
+    as quickly.
+    """
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        probe.bind(('', 11111))
+        probe.settimeout(timeout)
+        try:
+            probe.recv(2048)
+            return True
+        except socket.timeout:
+            return False
+    except OSError:
+        # Could not bind the probe (port already held); fall back to a
+        # short fixed wait
+        time.sleep(1)
+        return True
+    finally:
+        probe.close()
+
+
 def watch_video_stream(command_socket, command_addr):
     """
     Start and display video stream from Tello
-    """    
+    """
     response = send_command(command_socket, command_addr, "streamon")
     if response != "ok":
         print("   Failed to start video stream. Response:", response)
@@ -84,96 +394,341 @@ def watch_video_stream(command_socket, command_addr):
     print("\n   Video streaming started!")
     print("   Connecting to video stream (this may take a few seconds)...")
     
-    # Allow some time for streaming to initialize
-    time.sleep(2)
-    
-    # Try to connect to the stream with multiple attempts
-    cap = None
-    for attempt in range(3):
-        try:
-            cap = cv2.VideoCapture('udp://192.168.10.1:11111')
-            if cap.isOpened():
-                print("    Connected to video stream!")
-                break
-            else:
-                print(f"    Attempt {attempt+1}/3: Could not open video stream, retrying...")
-                time.sleep(2)
-        except Exception as e:
-            print(f"    Video stream error: {str(e)}")
-            time.sleep(2)
-    
-    if cap is None or not cap.isOpened():
-        print("    Failed to connect to video stream after multiple attempts")
+    # Wait only until the drone actually starts sending video
+    if _probe_video_stream():
+        print("    Video data detected")
+    else:
+        print("    No video data received yet; trying to open the stream anyway")
+
+    # Open the capture once; FFmpeg's read-attempt budget absorbs a slow
+    # stream start, and the probe above already confirmed data is flowing,
+    # so the old open-retry loop only added up to 4 s of cold-start time
+    cap = cv2.VideoCapture(TELLO_VIDEO_URL, cv2.CAP_FFMPEG)
+    if not cap.isOpened():
+        print("    Failed to connect to video stream")
         send_command(command_socket, command_addr, "streamoff")
         return False
-    
-    # Count frames to detect video stream issues
-    frame_count = 0
-    start_time = time.time()
-    
-    try:
-        while True:
-            ret, frame = cap.read()
-            if ret:
-                frame_count += 1
-                elapsed = time.time() - start_time
-                
-                # Display FPS every 30 frames
-                if frame_count % 30 == 0:
-                    fps = frame_count / elapsed
-                    cv2.putText(frame, f"FPS: {fps:.1f}", (10, 30), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                
-                cv2.imshow('Tello Video Stream', frame)
-                key = cv2.waitKey(1) & 0xFF
-                if key == 27:  # 'Esc' key
-                    break
+    print("    Connected to video stream!")
+
+    # Keep at most one frame buffered so display latency doesn't build up
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # Single-slot swap buffer between the decode thread and the display
+    # loop: the producer overwrites unconditionally, so the consumer always
+    # paints the newest frame and backlog is dropped on purpose. The
+    # condition lets the consumer sleep until a frame is published instead
+    # of polling.
+    frame_cond = threading.Condition()
+    latest = [None]
+    stop_event = threading.Event()
+
+    # Single-slot result handoff from the reconnect thread; each reopen
+    # runs on a short-lived daemon thread so an FFmpeg probe still pending
+    # at exit can't delay interpreter shutdown
+    reopen_result = [None]
+
+    def _reopen(delay):
+        time.sleep(delay)
+        reopen_result[0] = cv2.VideoCapture(TELLO_VIDEO_URL, cv2.CAP_FFMPEG)
+
+    def _start_reopen(delay):
+        reopen_result[0] = None
+        reopener = threading.Thread(target=_reopen, args=(delay,))
+        reopener.daemon = True
+        reopener.start()
+        return reopener
+
+    def _read_frames():
+        nonlocal cap
+        # The VideoCapture constructor can block for seconds of FFmpeg
+        # probing, so reconnects run off-thread while the last good frame
+        # stays on screen
+        pending = None
+        delay = 0.25
+
+        while not stop_event.is_set():
+            if pending is not None:
+                if pending.is_alive():
+                    time.sleep(0.05)
+                    continue
+                new_cap = reopen_result[0]
+                pending = None
+                if new_cap is not None and new_cap.isOpened():
+                    cap = new_cap
+                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                    delay = 0.25
+                    print("    Video stream reconnected")
+                else:
+                    if new_cap is not None:
+                        new_cap.release()
+                    delay *= 2
+                    if delay > 2.0:
+                        print("    Failed to recover video stream")
+                        stop_event.set()
+                        with frame_cond:
+                            frame_cond.notify_all()
+                        break
+                    pending = _start_reopen(delay)
+                    continue
+
+            # grab() pulls the next frame off the stream; the H.264
+            # decode only happens in retrieve(), so a failed grab costs
+            # no decode. CAP_PROP_BUFFERSIZE=1 keeps the queue at one
+            # frame deep.
+            if cap.grab():
+                ret, frame = cap.retrieve()
+                if ret:
+                    with frame_cond:
+                        latest[0] = frame
+                        frame_cond.notify()
             else:
-                # If we can't read a frame, try to reconnect
-                print("    Video frame lost, attempting to reconnect...")
-                cap.release()
-                cap = cv2.VideoCapture('udp://192.168.10.1:11111')
-                if not cap.isOpened():
-                    print("    Failed to reconnect to video stream")
-                    break
+                # A short grab() retry first; only a real stall pays
+                # for a background reopen
+                print("    Video frame lost, retrying...")
+                recovered = False
+                for _ in range(10):
+                    if stop_event.is_set() or cap.grab():
+                        recovered = True
+                        break
+                    time.sleep(0.05)
+                if not recovered and not stop_event.is_set():
+                    print("    Reconnecting to video stream in the background...")
+                    # Release first: the dead capture still holds local UDP
+                    # port 11111, and FFmpeg's unicast UDP input won't bind
+                    # a held port, so a reopen before release can't succeed
+                    cap.release()
+                    pending = _start_reopen(delay)
+
+    reader = threading.Thread(target=_read_frames)
+    reader.daemon = True
+    reader.start()
+
+    # Smoothed FPS estimate, updated per displayed frame; monotonic so a
+    # wall-clock step can't produce a negative or absurd interval
+    fps = 0.0
+    last_frame_time = time.monotonic()
+
+    # HUD sprite: the static "FPS:" label is rasterized once; only the
+    # numeric part is redrawn when the value changes, and the sprite is
+    # blended onto the frame with a single cv2.add instead of running the
+    # Hershey rasterizer over the whole text every frame
+    hud = np.zeros((40, 200, 3), np.uint8)
+    cv2.putText(hud, "FPS:", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    last_fps_draw = 0.0
+
+    # With TELLO_HEADLESS set, frames go into a shared memory block named
+    # 'tello_frame' (one memcpy each) for external consumers instead of a
+    # GUI window — no X11/Wayland round trip per frame on a robot with no
+    # display attached
+    headless = bool(os.getenv('TELLO_HEADLESS'))
+    shm = None
+    shm_view = None
+
+    # Bind the per-frame callables to locals once; at 30 FPS the repeated
+    # module/attribute lookups are the only Python-level cost left in this
+    # loop
+    monotonic = time.monotonic
+    imshow = cv2.imshow
+    wait_key = cv2.waitKey
+    put_text = cv2.putText
+    cv_add = cv2.add
+
+    try:
+        while not stop_event.is_set():
+            with frame_cond:
+                if latest[0] is None:
+                    frame_cond.wait(timeout=0.5)
+                frame = latest[0]
+                latest[0] = None
+            if frame is None:
+                continue
+
+            now = monotonic()
+            dt = now - last_frame_time
+            last_frame_time = now
+            if dt > 0:
+                # Exponentially weighted average keeps the readout smooth
+                fps = fps * 0.9 + (1.0 / dt) * 0.1 if fps else 1.0 / dt
+
+            if headless:
+                if shm is None:
+                    try:
+                        shm = shared_memory.SharedMemory(
+                            name='tello_frame', create=True, size=frame.nbytes)
+                    except FileExistsError:
+                        shm = shared_memory.SharedMemory(name='tello_frame')
+                    shm_view = np.ndarray(frame.shape, frame.dtype, buffer=shm.buf)
+                    print(f"    Headless mode: publishing {frame.shape} frames "
+                          "to shared memory 'tello_frame'")
+                if frame.shape == shm_view.shape:
+                    shm_view[:] = frame  # One memcpy, no GUI work
+                continue
+
+            # Re-format and re-rasterize the number only once a second; the
+            # cached sprite is still blended onto every frame, so the
+            # readout neither flickers nor costs per-frame formatting
+            if now - last_fps_draw > 1.0:
+                hud[:, 90:] = 0
+                put_text(hud, f"{fps:.1f}", (90, 30),
+                         cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                last_fps_draw = now
+            if frame.shape[0] >= 40 and frame.shape[1] >= 200:
+                roi = frame[0:40, 0:200]
+                cv_add(roi, hud, dst=roi)
+
+            imshow('Tello Video Stream', frame)
+            key = wait_key(1) & 0xFF
+            if key == 27:  # 'Esc' key
+                break
     except Exception as e:
         print(f"    Error in video stream: {str(e)}")
     finally:
+        stop_event.set()
+        reader.join(timeout=2)
         if cap:
             cap.release()
-        cv2.destroyAllWindows()
+        if shm is not None:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        if not headless:
+            cv2.destroyAllWindows()
         send_command(command_socket, command_addr, "streamoff")
         print("   Video stream stopped")
 
 
+# Latest telemetry, refreshed by the background keep-alive thread and read
+# by the keypress handlers so they don't block on a round-trip
+_telemetry_lock = threading.Lock()
+_telemetry = {'battery': None, 'status': None, 'status_time': 0.0}
+
+TELEMETRY_INTERVAL = 5  # Seconds between keep-alive battery polls
+STATUS_MAX_AGE = 5      # Re-poll status? when the cache is older than this
+
+
+def _telemetry_loop(command_socket, command_addr):
+    """
+    Poll the battery level at a low rate and cache the reply.
+
+    This doubles as the SDK keep-alive: Tello leaves SDK mode after 15 s
+    without traffic, which would silently break every later command.
+    """
+    while True:
+        battery = send_command(command_socket, command_addr, "battery?",
+                               debug=False, binary=True)
+        if battery:
+            with _telemetry_lock:
+                _telemetry['battery'] = battery
+        time.sleep(TELEMETRY_INTERVAL)
+
+
+def start_telemetry(command_socket, command_addr):
+    """
+    Start the daemon thread that keeps the telemetry cache warm
+    """
+    telemetry = threading.Thread(target=_telemetry_loop,
+                                 args=(command_socket, command_addr))
+    telemetry.daemon = True
+    telemetry.start()
+    return telemetry
+
+
 def get_tello_status(command_socket, command_addr):
     """
     Get all available status information from Tello for debugging
+
+    Served from the telemetry cache when fresh enough; only a stale or
+    empty cache costs a round-trip to the drone.
     """
     print("\n    Requesting Tello status...")
-    
-    # Request status information
-    response = send_command(command_socket, command_addr, "status?")
+
+    with _telemetry_lock:
+        response = _telemetry['status']
+        age = time.time() - _telemetry['status_time']
+
+    if response is None or age > STATUS_MAX_AGE:
+        response = send_command(command_socket, command_addr, "status?",
+                                binary=True)
+        if response:
+            with _telemetry_lock:
+                _telemetry['status'] = response
+                _telemetry['status_time'] = time.time()
+
     if not response:
         print("    Failed to get status information")
         return
-        
+
     # Parse and display information
     print("\n    Tello Status Information:")
     print("   " + "=" * 40)
     
-    try:
-        status_items = response.split(';')
-        for item in status_items:
-            if item:  # Skip empty items
-                key, value = item.split(':') if ':' in item else (item, "N/A")
-                print(f"   {key.strip()}: {value.strip()}")
-    except Exception as e:
-        print(f"    Error parsing status: {str(e)}")
-        print(f"   Raw status: {response}")
+    parsed = False
+    for match in _STATUS_RE.finditer(response):
+        parsed = True
+        key, value = match.groups()
+        print(f"   {key.decode(errors='replace').strip()}: "
+              f"{value.decode(errors='replace').strip()}")
+    if not parsed:
+        print("    Could not parse status response")
+        print(f"   Raw status: {response!r}")
     
     print("   " + "=" * 40)
 
+# Hotkey handlers enqueue their work here; a single worker thread performs
+# the blocking UDP round-trips. The keyboard library dispatches all hooks
+# from one internal thread, so a command awaiting its reply inline would
+# stall every other hotkey, including emergency.
+_hotkey_queue = queue.SimpleQueue()
+
+
+def _hotkey_worker():
+    while True:
+        action = _hotkey_queue.get()
+        try:
+            action()
+        except Exception as e:
+            print(f"   Hotkey action failed: {str(e)}")
+
+
+def start_hotkey_worker():
+    """
+    Start the daemon thread that runs queued hotkey actions
+    """
+    worker = threading.Thread(target=_hotkey_worker)
+    worker.daemon = True
+    worker.start()
+    return worker
+
+
+# Guards against a second keypress opening a second WiFi prompt
+_wifi_prompt_lock = threading.Lock()
+
+
+def configure_wifi_async(command_socket, command_addr):
+    """
+    Run the interactive WiFi prompt on its own thread.
+
+    configure_wifi blocks on input(); run directly from a keyboard hook it
+    would freeze every other hotkey (including emergency stop) until the
+    user finished typing.
+    """
+    if not _wifi_prompt_lock.acquire(blocking=False):
+        print("    WiFi configuration already in progress")
+        return
+
+    def _run():
+        try:
+            configure_wifi(command_socket, command_addr)
+        finally:
+            _wifi_prompt_lock.release()
+
+    prompt_thread = threading.Thread(target=_run)
+    prompt_thread.daemon = True
+    prompt_thread.start()
+
+
 def configure_wifi(command_socket, command_addr):
     """
     Configure Tello WiFi settings
@@ -202,36 +757,97 @@ def configure_wifi(command_socket, command_addr):
         return False
 
 
-def establish_connection(max_attempts=3):
+def _pin_cpu():
+    """
+    Pin the calling thread to one CPU so the command path stays in one
+    cache domain.
+
+    Controlled by the TELLO_CPU environment variable (core number); unset
+    means no pinning. For the full effect, point the WiFi NIC's IRQ at the
+    same core (echo the CPU mask into /proc/irq/<N>/smp_affinity).
+    """
+    cpu = os.environ.get('TELLO_CPU')
+    if cpu is None or not hasattr(os, 'sched_setaffinity'):
+        return
+    try:
+        os.sched_setaffinity(0, {int(cpu)})
+    except (ValueError, OSError) as e:
+        print(f"    Could not pin to CPU {cpu}: {e}")
+
+
+def establish_connection(max_attempts=3, first_timeout=0.5):
     """
     Establish and verify connection with the Tello drone
+
+    The drone answers the SDK-mode handshake quickly when it answers at
+    all, so attempts use a short timeout that doubles per retry and brief
+    backoff sleeps; a drone that is simply absent fails in a few seconds
+    instead of twenty.
     """
     print("\n    Establishing connection with Tello drone...")
-    
+
+    # Reused across attempts; the handshake reply is read into this rather
+    # than a freshly allocated bytes object
+    handshake_buf = bytearray(1024)
+
     for attempt in range(max_attempts):
+        backoff = 0.25 * (1 << attempt)
         try:
             print(f"   Attempt {attempt+1}/{max_attempts} to connect")
-            
+
             # Create socket
             command_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # SO_REUSEADDR only — SO_REUSEPORT would let a second instance
+            # bind 8889 and have the kernel split the drone's replies
+            # between the two processes; better that it fails loudly below
             command_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            
-            # Set timeout for socket operations
-            command_socket.settimeout(5)
+
+            # Enlarge the socket buffers so bursts of replies (battery/status
+            # while video is streaming) don't get dropped by the OS default
+            # (~208 KB on Linux). The kernel caps this at net.core.rmem_max;
+            # raise it with `sysctl -w net.core.rmem_max=12582912` if needed.
+            command_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            command_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+            rcvbuf = command_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if rcvbuf < 4 * 1024 * 1024:
+                print(f"    Receive buffer capped by OS at {rcvbuf} bytes (raise net.core.rmem_max for more)")
+
+            # Mark control packets Expedited Forwarding so they get priority
+            # over background traffic; not all platforms honour/allow this
+            try:
+                command_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0xB8)
+            except (OSError, AttributeError):
+                pass
+
+            # Busy-poll the NIC for up to 50 us before sleeping on a read,
+            # shaving a scheduler wakeup off the reply latency (Linux only,
+            # may need CAP_NET_ADMIN; ignored where unsupported)
+            try:
+                command_socket.setsockopt(
+                    socket.SOL_SOCKET, getattr(socket, 'SO_BUSY_POLL', 46), 50)
+            except OSError:
+                pass
+
+            # Short handshake timeout, doubled on each connection attempt
+            command_socket.settimeout(first_timeout * (1 << attempt))
             
             # Define address
             command_addr = ('192.168.10.1', 8889)
             
-            # Bind socket
+            # Bind socket. On machines with several interfaces (ethernet +
+            # WiFi), binding to the Tello-facing address avoids replies
+            # racing through the wrong interface; set TELLO_LOCAL_IP to the
+            # local address of the Tello WiFi adapter to pin it.
+            local_ip = os.environ.get('TELLO_LOCAL_IP', '')
             try:
-                command_socket.bind(('', 8889))
+                command_socket.bind((local_ip, 8889))
                 print("    Socket binding successful")
             except socket.error as e:
                 print(f"    Socket binding failed: {e}")
                 print("    Port 8889 might be in use by another application")
                 if attempt == max_attempts - 1:
                     return None
-                time.sleep(2)
+                time.sleep(backoff)
                 continue
             
             # Enter SDK mode
@@ -239,11 +855,13 @@ def establish_connection(max_attempts=3):
             command_socket.sendto(b"command", command_addr)
             
             try:
-                response, _ = command_socket.recvfrom(1024)
-                response = response.decode().strip()
-                
+                nbytes, _ = command_socket.recvfrom_into(handshake_buf)
+                response = handshake_buf[:nbytes].decode().strip()
+
                 if response == "ok":
                     print("    Successfully entered SDK mode")
+                    # From here on the receiver thread owns all reads
+                    start_receiver(command_socket)
                     return command_socket, command_addr
                 else:
                     print(f"    Unexpected response to SDK mode: {response}")
@@ -252,12 +870,12 @@ def establish_connection(max_attempts=3):
                 print("    Is the drone powered on? Are you connected to Tello WiFi?")
             except Exception as e:
                 print(f"    Error during connection: {str(e)}")
-            
-            time.sleep(2)
-        
+
+            time.sleep(backoff)
+
         except Exception as e:
             print(f"    Connection error: {str(e)}")
-            time.sleep(2)
+            time.sleep(backoff)
     
     print("    Failed to establish connection after multiple attempts")
     print("   ℹ Troubleshooting tips:")
@@ -267,6 +885,25 @@ def establish_connection(max_attempts=3):
     print("     4. Try restarting the drone")
     return None
 
+def _build_stick_lut():
+    """
+    Map the top byte of a signed 16-bit stick value to its normalized
+    -100..100 output with the deadzone pre-applied.
+
+    Indexing this table replaces a float division, an abs and a branch on
+    every stick event.
+    """
+    lut = []
+    for i in range(256):
+        top = i - 256 if i >= 128 else i
+        norm = top * 256 / 327.67
+        lut.append(0 if abs(norm) < 15 else int(norm))
+    return tuple(lut)
+
+
+_STICK_LUT = _build_stick_lut()
+
+
 class XboxController(threading.Thread):
     """
     Xbox controller handling class. Manages controller inputs and converts them to drone commands.
@@ -280,33 +917,122 @@ class XboxController(threading.Thread):
         
         # Initialize controller state
         self.left_thumb_y = 0  # Up/Down movement
-        self.last_command_time = time.time()
-        self.command_delay = 0.5  # Minimum time between commands (seconds)
+        # Monotonic integer nanoseconds: immune to wall-clock steps and
+        # compared without any float math
+        self.last_command_time = time.monotonic_ns()
+        self.command_delay_ns = 500_000_000  # Minimum time between commands
         
     def run(self):
         """
         Main loop to read controller inputs and send commands
         """
         self.running = True
+        # Keep the event read-loop and the UDP sends it triggers on the
+        # same core as the rest of the command path
+        _pin_cpu()
         print("    Xbox controller support enabled. Connect your controller via Bluetooth.")
         print("    Controls:")
         print("    - Left thumbstick: Up/Down movement")
         print("    - A button: Takeoff")
         print("    - B button: Land")
         print("    - X button: Emergency stop")
-        
+
+        if _HAS_EVDEV:
+            self._run_evdev()
+        else:
+            self._run_inputs()
+
+    def _run_evdev(self):
+        """
+        Event-driven loop: block on the kernel event fd, dispatch by
+        integer event code
+
+        A moving stick emits hundreds of one-LSB ABS_Y events per second
+        while the movement tick only acts every 0.5 s, so each wakeup
+        drains everything pending and maps only the newest stick value.
+        """
+        key_handlers = {ecodes.BTN_SOUTH: self._on_takeoff,
+                        ecodes.BTN_EAST: self._on_land,
+                        ecodes.BTN_WEST: self._on_emergency}
+
         while self.running:
+            device = self._find_gamepad()
+            if device is None:
+                print("    Waiting for Xbox controller connection...")
+                time.sleep(3)  # Wait before trying again
+                continue
+            device_sel = selectors.DefaultSelector()
+            device_sel.register(device, selectors.EVENT_READ)
             try:
+                while self.running:
+                    if not device_sel.select(timeout=1.0):
+                        continue
+                    last_stick_y = None
+                    for event in device.read():
+                        if event.type == ecodes.EV_ABS:
+                            if event.code == ecodes.ABS_Y:
+                                last_stick_y = event.value
+                        elif event.type == ecodes.EV_KEY and event.value == 1:
+                            handler = key_handlers.get(event.code)
+                            if handler:
+                                handler(event.value)
+                    if last_stick_y is not None:
+                        self._on_stick_y(last_stick_y)
+
+                    # Check if we should send a movement command based on
+                    # thumbstick position
+                    self._process_movement_commands()
+            except OSError:
+                print("    Controller disconnected")
+                time.sleep(1)
+            finally:
+                device_sel.close()
+                try:
+                    device.close()
+                except OSError:
+                    pass
+
+    def _find_gamepad(self):
+        """
+        Pick the first input device that actually looks like a gamepad
+        """
+        for path in list_devices():
+            try:
+                device = InputDevice(path)
+            except OSError:
+                continue
+            caps = device.capabilities()
+            # Absolute axes plus keys also matches touchpads and other
+            # pointing devices, whose ABS_Y would fly the drone; require a
+            # gamepad button (BTN_GAMEPAD is the A/BTN_SOUTH code) too
+            if (ecodes.EV_ABS in caps
+                    and ecodes.BTN_GAMEPAD in caps.get(ecodes.EV_KEY, [])):
+                return device
+            device.close()
+        return None
+
+    def _run_inputs(self):
+        """
+        Fallback polling loop via the inputs library (non-Linux platforms)
+        """
+        while self.running:
+            try:
+                # get_gamepad returns a batch; buttons are handled per
+                # event but only the newest stick value is mapped
                 events = get_gamepad()
+                last_stick_y = None
                 for event in events:
                     if event.ev_type == "Absolute":
-                        self._handle_analog_input(event)
+                        if event.code == "ABS_Y":
+                            last_stick_y = event.state
                     elif event.ev_type == "Key":
                         self._handle_button_press(event)
-                
+                if last_stick_y is not None:
+                    self._on_stick_y(last_stick_y)
+
                 # Check if we should send a movement command based on thumbstick position
                 self._process_movement_commands()
-                
+
                 # Small sleep to prevent high CPU usage
                 time.sleep(0.01)
             except Exception as e:
@@ -316,16 +1042,30 @@ class XboxController(threading.Thread):
                 else:
                     print(f"    Controller error: {str(e)}")
                     time.sleep(1)
-    
-    def _handle_analog_input(self, event):
+
+    def _on_stick_y(self, value):
         """
-        Process analog inputs like thumbsticks
+        Left thumbstick Y axis (up/down)
         """
-        # Left thumbstick Y axis (up/down)
-        if event.code == "ABS_Y":
-            # Convert raw input (-32768 to 32767) to normalized value (-100 to 100)
-            self.left_thumb_y = -1 * self._map_stick_value(event.state)
-    
+        # Convert raw input (-32768 to 32767) to normalized value (-100 to 100)
+        self.left_thumb_y = -1 * self._map_stick_value(value)
+
+    def _on_takeoff(self, _value):
+        print("    A Button pressed: Takeoff")
+        send_command(self.command_socket, self.command_addr, "takeoff",
+                     retry=1, initial_timeout=TAKEOFF_TIMEOUT)
+
+    def _on_land(self, _value):
+        print("    B Button pressed: Land")
+        send_command(self.command_socket, self.command_addr, "land",
+                     retry=1, initial_timeout=MOVE_TIMEOUT)
+
+    def _on_emergency(self, _value):
+        print("    X Button pressed: EMERGENCY STOP")
+        # Send emergency command directly without waiting for response,
+        # repeated for reliability
+        send_burst(self.command_socket, self.command_addr, "emergency")
+
     def _handle_button_press(self, event):
         """
         Process button presses
@@ -333,64 +1073,50 @@ class XboxController(threading.Thread):
         # Only handle button down events (value 1)
         if event.state != 1:
             return
-            
+
         # A Button - Takeoff
         if event.code == "BTN_SOUTH":
-            print("    A Button pressed: Takeoff")
-            send_command(self.command_socket, self.command_addr, "takeoff")
-            
+            self._on_takeoff(event.state)
+
         # B Button - Land
         elif event.code == "BTN_EAST":
-            print("    B Button pressed: Land")
-            send_command(self.command_socket, self.command_addr, "land")
-            
+            self._on_land(event.state)
+
         # X Button - Emergency stop
         elif event.code == "BTN_WEST":
-            print("    X Button pressed: EMERGENCY STOP")
-            try:
-                # Send emergency command directly without waiting for response
-                self.command_socket.sendto(b"emergency", self.command_addr)
-                self.command_socket.sendto(b"emergency", self.command_addr)
-                self.command_socket.sendto(b"emergency", self.command_addr)
-            except Exception as e:
-                print(f"    Error sending emergency stop: {str(e)}")
+            self._on_emergency(event.state)
     
     def _process_movement_commands(self):
         """
         Process movement commands based on thumbstick position
         """
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         # Only send commands if enough time has passed since last command
-        if current_time - self.last_command_time < self.command_delay:
+        if current_time - self.last_command_time < self.command_delay_ns:
             return
             
-        # Up/Down movement based on left thumbstick Y
+        # Up/Down movement based on left thumbstick Y; 30 cm per step
         if abs(self.left_thumb_y) > 30:  # Apply a deadzone
-            distance = 30  # Movement distance in cm
-            
             if self.left_thumb_y > 0:
                 # Move up
-                print(f"    Moving up {distance}cm")
-                send_command(self.command_socket, self.command_addr, f"up {distance}")
+                print("    Moving up 30cm")
+                send_command(self.command_socket, self.command_addr, _UP30,
+                             retry=1, initial_timeout=MOVE_TIMEOUT)
             else:
                 # Move down
-                print(f"    Moving down {distance}cm")
-                send_command(self.command_socket, self.command_addr, f"down {distance}")
-                
+                print("    Moving down 30cm")
+                send_command(self.command_socket, self.command_addr, _DOWN30,
+                             retry=1, initial_timeout=MOVE_TIMEOUT)
+
             self.last_command_time = current_time
     
     def _map_stick_value(self, value):
         """
         Map raw thumbstick value to -100 to 100 range with a deadzone
         """
-        # Normalize value from -32768/32767 to -100/100
-        normalized = value / 327.67
-        
-        # Apply deadzone (values between -15 and 15 become 0)
-        if abs(normalized) < 15:
-            return 0
-            
-        return normalized
+        # One shift + mask + table index; the LUT carries the
+        # normalization and deadzone
+        return _STICK_LUT[(value >> 8) & 0xFF]
     
     def stop(self):
         """
@@ -400,15 +1126,25 @@ class XboxController(threading.Thread):
 
 
 def main():
+    # Optionally pin to one core (TELLO_CPU) so the reply path doesn't
+    # bounce between cache domains
+    _pin_cpu()
+
     print("""
-    Tello Drone Controller 
+    Tello Drone Controller
    ============================""")
     print("    Connect to Tello WiFi network and press <<Shift>> to continue")
     print("    Waiting for connection...")
-    
-    while not keyboard.is_pressed("Shift"):
-        pass
-    
+
+    # Block until Shift is pressed instead of spinning at 100% CPU. On
+    # Linux the keyboard library needs root for its hooks; fall back to a
+    # plain Enter prompt rather than crashing.
+    try:
+        keyboard.wait("shift")
+    except (OSError, ValueError) as e:
+        print(f"    Keyboard hook unavailable ({e})")
+        input("   Press Enter to continue instead...")
+
     print("    Starting connection process...")
     
     # Establish connection
@@ -426,45 +1162,53 @@ def main():
         return
         
     print("    Control has been successfully established!")
-    
-    # Create video thread but don't start automatically
-    video_thread = threading.Thread(target=watch_video_stream, args=(command_socket, command_addr))
-    video_thread.daemon = True
-    video_started = False
-    
+
+    # Keep the SDK session alive and the telemetry cache warm
+    start_telemetry(command_socket, command_addr)
+
+    # Video thread is created lazily on the first keypress; it also can't
+    # be started twice by accident
+    video_thread = [None]
+
     # Initialize Xbox controller thread
     controller = XboxController(command_socket, command_addr)
     controller.start()
-    
-    # Define video start function with closure to access video_started variable
+
     def start_video():
-        nonlocal video_started
-        if not video_started:
-            video_thread.start()
-            video_started = True
+        if video_thread[0] is None:
+            video_thread[0] = threading.Thread(
+                target=watch_video_stream, args=(command_socket, command_addr))
+            video_thread[0].daemon = True
+            video_thread[0].start()
         else:
             print("    Video stream already started")
               # Define emergency stop function
     def emergency_stop():
-        try:
-            print("    EMERGENCY STOP ACTIVATED")
-            # Send emergency command directly without waiting for response
-            command_socket.sendto(b"emergency", command_addr)
-            # Send multiple times to ensure it's received
-            command_socket.sendto(b"emergency", command_addr)
-            command_socket.sendto(b"emergency", command_addr)
-            print("    Emergency stop command sent")
-        except Exception as e:
-            print(f"    Error sending emergency stop: {str(e)}")
+        print("    EMERGENCY STOP ACTIVATED")
+        # Send emergency command directly without waiting for response,
+        # multiple times to ensure it's received
+        send_burst(command_socket, command_addr, "emergency")
+        print("    Emergency stop command sent")
     
-    # Setup command handlers
+    # Setup command handlers. Anything that waits on a drone reply goes
+    # through the hotkey queue so the hook thread never blocks; emergency
+    # stays inline because it never waits, and the video/wifi handlers
+    # already hand off to their own threads.
+    start_hotkey_worker()
     keyboard.on_press_key("1", lambda _: emergency_stop())
     keyboard.on_press_key("2", lambda _: start_video())
-    keyboard.on_press_key("3", lambda _: send_command(command_socket, command_addr, "land"))
-    keyboard.on_press_key("4", lambda _: configure_wifi(command_socket, command_addr))
-    keyboard.on_press_key("6", lambda _: get_tello_status(command_socket, command_addr))
-    keyboard.on_press_key("t", lambda _: send_command(command_socket, command_addr, "takeoff"))
-    keyboard.on_press_key("u", lambda _: move_up())
+    keyboard.on_press_key("3", lambda _: _hotkey_queue.put(
+        lambda: send_command(command_socket, command_addr, "land",
+                             retry=1, initial_timeout=MOVE_TIMEOUT)))
+    keyboard.on_press_key("4", lambda _: configure_wifi_async(command_socket, command_addr))
+    keyboard.on_press_key("6", lambda _: _hotkey_queue.put(
+        lambda: get_tello_status(command_socket, command_addr)))
+    keyboard.on_press_key("t", lambda _: _hotkey_queue.put(
+        lambda: send_command(command_socket, command_addr, "takeoff",
+                             retry=1, initial_timeout=TAKEOFF_TIMEOUT)))
+    keyboard.on_press_key("u", lambda _: _hotkey_queue.put(
+        lambda: send_command(command_socket, command_addr, "up 50",
+                             retry=1, initial_timeout=MOVE_TIMEOUT)))
     
     print("""    CONTROLS:
     ===========
@@ -485,8 +1229,8 @@ def main():
     X Button: Emergency Stop    """)
     
     try:
-        while not keyboard.is_pressed("5"):
-            time.sleep(0.1)  # Reduce CPU usage
+        # Block in the keyboard hook until the exit key fires; no polling
+        keyboard.wait("5")
     except KeyboardInterrupt:
         print("\n   ℹ Program interrupted")
     finally:
@@ -495,12 +1239,17 @@ def main():
         try:
             # Stop controller thread
             controller.stop()
-            
-            # Try to land the drone if it might be flying
-            send_command(command_socket, command_addr, "land", debug=False)
+
+            # Try to land the drone if it might be flying; don't block
+            # shutdown waiting for acknowledgements
+            send_command_async(command_socket, command_addr, "land")
             time.sleep(1)
             # Turn off video stream if it was on
-            send_command(command_socket, command_addr, "streamoff", debug=False)
+            send_command_async(command_socket, command_addr, "streamoff")
+
+            # Closing the socket wakes the receiver thread so it exits
+            # instead of lingering until process teardown
+            command_socket.close()
         except:
             pass  # Ignore errors during shutdown
         